@@ -45,6 +45,18 @@ DOOR_HANDLE_EP_ID = 2
 VIBRATION_EP_ID = 3
 
 
+def _alarm_1_converter(
+    value: int, _alarm_1: ZoneStatus = ZoneStatus.Alarm_1
+) -> ZoneStatus:
+    """Map a Tuya boolean data point onto the IasZone Alarm_1 bit."""
+    return _alarm_1 & value
+
+
+def _battery_converter(value: int) -> int:
+    """Convert a 1% step battery percentage to the ZCL 0.5% step scale."""
+    return 2 * value
+
+
 class CustomBasicCluster(CustomCluster, Basic):
     """Custom Basic cluster to report power source."""
 
@@ -62,20 +74,28 @@ class CustomTuyaPowerConfigurationCluster(TuyaLocalCluster, PowerConfiguration):
     }
 
 
-class CustomTuyaContactSwitchCluster(TuyaLocalCluster, IasZone):
-    """Custom IasZone cluster that represents the Open/Closed sensor."""
+class CustomTuyaIasZoneCluster(TuyaLocalCluster, IasZone):
+    """Custom IasZone cluster base for the Tuya data point driven sensors."""
 
     _CONSTANT_ATTRIBUTES = {
         IasZone.AttributeDefs.zone_state.id: ZONE_STATE,
+    }
+
+
+class CustomTuyaContactSwitchCluster(CustomTuyaIasZoneCluster):
+    """Custom IasZone cluster that represents the Open/Closed sensor."""
+
+    _CONSTANT_ATTRIBUTES = {
+        **CustomTuyaIasZoneCluster._CONSTANT_ATTRIBUTES,
         IasZone.AttributeDefs.zone_type.id: ZoneType.Contact_Switch,
     }
 
 
-class CustomTuyaVibrationCluster(TuyaLocalCluster, IasZone):
+class CustomTuyaVibrationCluster(CustomTuyaIasZoneCluster):
     """Custom IasZone cluster that represents the vibration sensor."""
 
     _CONSTANT_ATTRIBUTES = {
-        IasZone.AttributeDefs.zone_state.id: ZONE_STATE,
+        **CustomTuyaIasZoneCluster._CONSTANT_ATTRIBUTES,
         IasZone.AttributeDefs.zone_type.id: ZoneType.Vibration_Movement_Sensor,
     }
 
@@ -93,28 +113,24 @@ class CustomTuyaDPProcessor(TuyaNewManufCluster):
             endpoint_id=DOOR_HANDLE_EP_ID,
             ep_attribute=IasZone.ep_attribute,
             attribute_name=IasZone.AttributeDefs.zone_status.name,
-            converter=lambda x: ZoneStatus.Alarm_1 & x,
+            converter=_alarm_1_converter,
         ),
         VIBRATION_DP_ID: DPToAttributeMapping(
             endpoint_id=VIBRATION_EP_ID,
             ep_attribute=IasZone.ep_attribute,
             attribute_name=IasZone.AttributeDefs.zone_status.name,
-            converter=lambda x: ZoneStatus.Alarm_1 & x,
+            converter=_alarm_1_converter,
         ),
         BATTERY_STATE_DP_ID: DPToAttributeMapping(
             endpoint_id=DP_HANDLER_EP_ID,
             ep_attribute=PowerConfiguration.ep_attribute,
             attribute_name=PowerConfiguration.AttributeDefs.battery_percentage_remaining.name,
-            converter=lambda x: 2 * x,
+            converter=_battery_converter,
             # Device measures battery in 1% steps, while the ZCL specifies it in 0.5% steps
         ),
     }
 
-    data_point_handlers = {
-        DOOR_HANDLE_DP_ID: "_dp_2_attr_update",
-        VIBRATION_DP_ID: "_dp_2_attr_update",
-        BATTERY_STATE_DP_ID: "_dp_2_attr_update",
-    }
+    data_point_handlers = dict.fromkeys(dp_to_attribute, "_dp_2_attr_update")
 
 
 class TS0601Door(CustomDevice):